@@ -1,8 +1,26 @@
 from typing import Dict, Any
+import functools
 import os
 import re
+import sys
+import threading
 from pydantic import Field
 
+# CMU phonemes carry their vowel as the first character and stress as the last
+_VOWELS = frozenset('AEIOU')
+_STRESSED = frozenset('12')
+_STRESS_MARKS = frozenset('012')
+
+# Runs of letters (including accented ones) and apostrophes, so "don't" and "'cause" stay whole
+_WORD_RE = re.compile(r"(?:[^\W\d_]|')+")
+
+_RHYME_BUCKETS = {1: "1_syllable", 2: "2_syllable", 3: "3_syllable"}
+_MAX_RHYMES = 20
+
+# Cleared while the dictionary tables are being built in the background
+_TABLES_READY = threading.Event()
+_TABLES_READY.set()
+
 # Lazy loading to prevent tool scanning timeouts
 def get_mcp():
     """Lazy-loaded FastMCP instance to avoid import-time dependencies."""
@@ -15,6 +33,142 @@ def get_nltk_dependencies():
     from nltk.corpus import cmudict
     return nltk, cmudict
 
+@functools.lru_cache(maxsize=1)
+def _get_cmu():
+    """
+    Load the CMU Pronouncing Dictionary once and reuse it across tool calls.
+
+    Words are interned and pronunciations are stored as tuples of interned
+    phonemes, so the ~70 distinct phoneme strings are shared and both words and
+    phoneme tuples compare by identity.
+    """
+    _, cmudict = get_nltk_dependencies()
+    return {
+        sys.intern(word): [tuple(map(sys.intern, pron)) for pron in pronunciations]
+        for word, pronunciations in cmudict.dict().items()
+    }
+
+def _count_pron_syllables(pron):
+    """Number of syllables in a pronunciation, i.e. its stress-marked vowels."""
+    return sum(1 for s in pron if s[-1] in _STRESS_MARKS)
+
+class _SyllableTable(dict):
+    """Word -> syllable count table that estimates out-of-dictionary words from their vowels."""
+
+    def __missing__(self, word):
+        # Retry without surrounding quotes, e.g. 'love', before falling back to vowels
+        stripped = word.strip("'")
+        if stripped != word and stripped in self:
+            return self[stripped]
+        return sum(map(word.count, "aeiouy"))
+
+@functools.lru_cache(maxsize=1)
+def _get_syllable_counts():
+    """Map each dictionary word to the syllable count of its first pronunciation."""
+    return _SyllableTable((word, _count_pron_syllables(prons[0])) for word, prons in _get_cmu().items())
+
+@functools.lru_cache(maxsize=1)
+def _get_rhyme_index():
+    """
+    Build a reverse-rhyme index over the CMU dictionary.
+
+    Maps every pronunciation tail that starts at a stressed vowel to the
+    (word, rhyme bucket) pairs that end with it, in dictionary order, so a
+    rhyme query becomes a single dict lookup instead of a full dictionary scan.
+    Pronunciations outside the 1-3 syllable buckets can never be returned and
+    are left out of the index entirely.
+    """
+    index = {}
+    for word, pronunciations in _get_cmu().items():
+        for pron in pronunciations:
+            bucket = _RHYME_BUCKETS.get(_count_pron_syllables(pron))
+            if bucket is None:
+                continue
+            for i, phoneme in enumerate(pron):
+                if phoneme[:1] in _VOWELS and phoneme[-1:] in _STRESSED:
+                    index.setdefault(pron[i:], []).append((word, bucket))
+    return index
+
+@functools.lru_cache(maxsize=8192)
+def _count_line(line):
+    """Syllable count for a single lowercased line of text, memoized for repeated lines."""
+    return sum(map(_get_syllable_counts().__getitem__, _WORD_RE.findall(line)))
+
+@functools.lru_cache(maxsize=1024)
+def _rhymes_for(word):
+    """
+    Rhymes for a lowercase dictionary word, bucketed by syllable count.
+
+    Buckets are returned as tuples so the memoized result cannot be mutated by callers.
+    """
+    input_pronunciations = _get_cmu()[word]
+    rhyme_index = _get_rhyme_index()
+
+    # Dicts double as insertion-ordered sets, keeping dictionary order in the output
+    rhymes = {key: {} for key in _RHYME_BUCKETS.values()}
+    saturated = False
+
+    for input_pron in input_pronunciations:
+        if saturated:
+            break
+
+        rhyme_part_index = -1
+        for i, phoneme in enumerate(input_pron):
+            if phoneme[:1] in _VOWELS and phoneme[-1:] in _STRESSED:
+                rhyme_part_index = i
+                break
+            
+        if rhyme_part_index == -1:
+            continue
+
+        rhyme_part = input_pron[rhyme_part_index:]
+
+        for candidate, key in rhyme_index.get(rhyme_part, ()):
+            if candidate == word or len(rhymes[key]) >= _MAX_RHYMES:
+                continue
+
+            rhymes[key][candidate] = None
+            if len(rhymes[key]) == _MAX_RHYMES and all(len(bucket) >= _MAX_RHYMES for bucket in rhymes.values()):
+                saturated = True
+                break
+        
+    return {key: tuple(words) for key, words in rhymes.items()}
+
+def _warm_tables():
+    """Build the dictionary tables the tools rely on, then unblock waiting tool calls."""
+    try:
+        _get_syllable_counts()
+        _get_rhyme_index()
+    finally:
+        _TABLES_READY.set()
+
+def _start_warmup():
+    """Build the dictionary tables in a background thread so the server can start accepting requests."""
+    _TABLES_READY.clear()
+    threading.Thread(target=_warm_tables, name="lyrical-mcp-warmup", daemon=True).start()
+
+async def _wait_for_tables():
+    """Wait for a background warmup to finish without blocking the server's event loop."""
+    if not _TABLES_READY.is_set():
+        import anyio
+        await anyio.to_thread.run_sync(_TABLES_READY.wait)
+
+def _lookup_rhymes(input_word):
+    """Rhymes for the last word of ``input_word``, or an error dict if it is not in the dictionary."""
+    d = _get_cmu()
+
+    # If the input contains multiple words, analyze only the last word
+    words = input_word.lower().split()
+    word_to_analyze = words[-1] if words else ""
+
+    if not word_to_analyze or word_to_analyze not in d:
+        return {"error": f"'{input_word}' (analyzed as '{word_to_analyze}') not found in dictionary or no valid word provided. Cannot find rhymes."}
+
+    # Intern only after the membership check: interned strings are immortal on 3.12+, and
+    # interning a CMU key just returns the existing key object
+    rhymes = _rhymes_for(sys.intern(word_to_analyze))
+    return {key: list(words) for key, words in rhymes.items()}
+
 def setup_tools(mcp):
     """Setup tools on the MCP server instance."""
 
@@ -32,7 +186,9 @@ def setup_tools(mcp):
             "timestamp": datetime.now().isoformat(),
             "server": "lyrical-mcp",
             "version": "1.0.0",
-            "tools_available": ["ping", "health_check", "count_syllables", "find_rhymes"]
+            "tools_available": [
+                "ping", "health_check", "count_syllables", "count_syllables_batch", "find_rhymes", "find_rhymes_batch"
+            ]
         }
 
     @mcp.tool(
@@ -42,7 +198,7 @@ def setup_tools(mcp):
             "openWorldHint": False
         }
     )
-    def count_syllables(
+    async def count_syllables(
             input_string: str = Field(description="Syllable count query string")
         ) -> list[int]:
         """
@@ -53,23 +209,29 @@ def setup_tools(mcp):
         text, such as for poetry metrics, lyrics, linguistic studies, or speech-related applications. If a line returns 
         0 syllables, assume this is a blank line, and you can ignore.
         """
-        nltk, cmudict = get_nltk_dependencies()
-        d = cmudict.dict()
-        syllable_counts = []
-        lines = input_string.splitlines()
-
-        for line in lines:
-            words = nltk.word_tokenize(line.lower())
-            line_syllables = 0
-            for word in words:
-                if word in d:
-                    pronunciation = d[word][0]
-                    syllables = [s for s in pronunciation if s[-1].isdigit()]
-                    line_syllables += len(syllables)
-                else:
-                    line_syllables += sum(1 for char in word if char in "aeiouy")
-            syllable_counts.append(line_syllables)
-        return syllable_counts
+        await _wait_for_tables()
+        return [_count_line(line) for line in input_string.lower().splitlines()]
+
+    @mcp.tool(
+        annotations={
+            "title": "Count Syllables (Batch)",
+            "readOnlyHint": True,
+            "openWorldHint": False
+        }
+    )
+    async def count_syllables_batch(
+            inputs: list[str] = Field(description="Syllable count query strings")
+        ) -> list[list[int]]:
+        """
+        Counts the number of syllables for each line of several English text strings in one call.
+        Returns one array of per-line syllable counts for each input string, in the same order as the inputs,
+        exactly as count_syllables would for each string on its own. Prefer this tool over repeated
+        count_syllables calls when analyzing multiple verses, drafts, or candidate lines at once.
+        """
+        await _wait_for_tables()
+        split_inputs = [input_string.lower().splitlines() for input_string in inputs]
+        counts = {line: _count_line(line) for lines in split_inputs for line in set(lines)}
+        return [[counts[line] for line in lines] for lines in split_inputs]
 
     @mcp.tool(
         annotations={
@@ -78,7 +240,7 @@ def setup_tools(mcp):
             "openWorldHint": False
         }
     )
-    def find_rhymes(input_word: str) -> dict[str, list[str]]:
+    async def find_rhymes(input_word: str) -> dict[str, list[str] | str]:
         """
         Finds rhyming words for a given input word or the last word of a phrase, categorized by syllable count (1, 2, or 3 syllables).
         This tool utilizes the NLTK's CMU Pronouncing Dictionary for accurate rhyme generation.
@@ -86,66 +248,32 @@ def setup_tools(mcp):
         If the input contains multiple words, only the last word will be analyzed for rhymes.
         Use this tool when the user requires rhyming word suggestions for creative writing, poetry, lyrics, or linguistic analysis.
         """
-        nltk, cmudict = get_nltk_dependencies()
-        d = cmudict.dict()
-        
-        # If the input contains multiple words, analyze only the last word
-        words = input_word.lower().split()
-        word_to_analyze = words[-1] if words else ""
-
-        if not word_to_analyze or word_to_analyze not in d:
-            return {"error": f"'{input_word}' (analyzed as '{word_to_analyze}') not found in dictionary or no valid word provided. Cannot find rhymes."}
+        await _wait_for_tables()
+        return _lookup_rhymes(input_word)
 
-        input_word_lower = word_to_analyze
-
-        if input_word_lower not in d:
-            return {"error": f"'{input_word}' not found in dictionary. Cannot find rhymes."}
-
-        input_pronunciations = d[input_word_lower]
-
-        rhymes = {
-            "1_syllable": [],
-            "2_syllable": [],
-            "3_syllable": []
+    @mcp.tool(
+        annotations={
+            "title": "Find Rhymes (Batch)",
+            "readOnlyHint": True,
+            "openWorldHint": False
         }
-
-        for input_pron in input_pronunciations:
-            rhyme_part_index = -1
-            for i, phoneme in enumerate(input_pron):
-                if re.match(r'[AEIOU].*[12]', phoneme):
-                    rhyme_part_index = i
-                    break
-            
-            if rhyme_part_index == -1:
-                continue
-
-            rhyme_part = input_pron[rhyme_part_index:]
-
-            for word, pronunciations in d.items():
-                if word == input_word_lower:
-                    continue
-
-                for pron in pronunciations:
-                    if len(pron) >= len(rhyme_part) and pron[-len(rhyme_part):] == rhyme_part:
-                        syllables = [s for s in pron if s[-1].isdigit()]
-                        syllable_count = len(syllables)
-
-                        if syllable_count == 1 and word not in rhymes["1_syllable"]:
-                            rhymes["1_syllable"].append(word)
-                        elif syllable_count == 2 and word not in rhymes["2_syllable"]:
-                            rhymes["2_syllable"].append(word)
-                        elif syllable_count == 3 and word not in rhymes["3_syllable"]:
-                            rhymes["3_syllable"].append(word)
-        
-        for key in rhymes:
-            rhymes[key] = rhymes[key][:20]
-
-        return rhymes
+    )
+    async def find_rhymes_batch(input_words: list[str]) -> dict[str, dict[str, list[str] | str]]:
+        """
+        Finds rhyming words for several input words or phrases in one call.
+        Returns a dictionary keyed by each distinct input, whose values are the same result find_rhymes
+        would return for that input: rhymes grouped under '1_syllable', '2_syllable' and '3_syllable',
+        or an 'error' entry if the word is not in the dictionary.
+        Prefer this tool over repeated find_rhymes calls when looking up rhymes for multiple line endings at once.
+        """
+        await _wait_for_tables()
+        return {input_word: _lookup_rhymes(input_word) for input_word in dict.fromkeys(input_words)}
 
 def main():
     """Main entry point for the syllables MCP server."""
     mcp = get_mcp()
     setup_tools(mcp)
+    _start_warmup()
     
     print("🌐 Starting lyrical MCP server")
     mcp.run()